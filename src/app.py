@@ -4,12 +4,18 @@ A web-based interface for downloading YouTube videos with quality and format opt
 """
 
 
+import html
 import os
+import queue
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Tuple
 import streamlit as st
-from downloader import YouTubeDownloader, URLValidator, Quality, VideoFormat # Import from downloader.py
+from downloader import YouTubeDownloader, URLValidator, Quality, VideoFormat, clean_filename # Import from downloader.py
 
 
 # Page config
@@ -32,12 +38,6 @@ st.markdown("""
     border-radius: 10px;
     margin-bottom: 2rem;
 }
-.download-section {
-    background-color: #f8f9fa;
-    padding: 1.5rem;
-    border-radius: 10px;
-    margin: 1rem 0;
-}
 .info-box {
     background-color: #e3f2fd;
     padding: 1rem;
@@ -45,6 +45,11 @@ st.markdown("""
     border-radius: 5px;
     margin: 1rem 0;
 }
+.info-grid {
+    display: grid;
+    grid-template-columns: 1fr 1fr;
+    gap: 0.25rem 1rem;
+}
 .success-box {
     background-color: #e8f5e8;
     padding: 1rem;
@@ -75,14 +80,14 @@ def initialize_session_state():
         st.session_state.progress = 0
     if 'current_stage' not in st.session_state:
         st.session_state.current_stage = ""
-
-
-def clean_filename(filename: str) -> str:
-    """Clean filename for safe file system usage."""
-    # Remove invalid filename characters
-    clean_name = re.sub(r'[<>:"/\\|?*]', '', filename)
-    clean_name = clean_name.strip()[:100]  # Limit length
-    return clean_name
+    if 'download_future' not in st.session_state:
+        st.session_state.download_future = None
+    if 'progress_hook' not in st.session_state:
+        st.session_state.progress_hook = None
+    if 'download_dir' not in st.session_state:
+        st.session_state.download_dir = None
+    if 'default_output_dir' not in st.session_state:
+        st.session_state.default_output_dir = os.getcwd()
 
 
 def format_duration(seconds: int) -> str:
@@ -93,16 +98,17 @@ def format_duration(seconds: int) -> str:
     return f"{mins:02d}:{secs:02d}"
 
 
+_SIZE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in bytes to human readable format."""
     if not size_bytes:
         return "Unknown"
 
-    for unit in ['B', 'KB', 'MB', 'GB']:
-        if size_bytes < 1024:
-            return f"{size_bytes:.1f} {unit}"
-        size_bytes /= 1024
-    return f"{size_bytes:.1f} TB"
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    idx = min(max(0, (int(size_bytes).bit_length() - 1) // 10), len(_SIZE_UNITS) - 1)
+    return f"{size_bytes / (1 << (idx * 10)):.1f} {_SIZE_UNITS[idx]}"
 
 
 def format_upload_date(date_str: str) -> str:
@@ -110,53 +116,142 @@ def format_upload_date(date_str: str) -> str:
     if not date_str or date_str == "Unknown":
         return "Unknown"
 
-    try:
-        # If date_str is in YYYYMMDD format (common from yt-dlp)
-        if len(date_str) == 8 and date_str.isdigit():
-            year = date_str[:4]
-            month = date_str[4:6]
-            day = date_str[6:8]
-            return f"{year}-{month}-{day}"
-        else:
-            # Try to parse other formats and convert to YYYY-MM-DD
-            # This handles various date formats that might be returned
-            return date_str
-    except:
-        return date_str
+    # If date_str is in YYYYMMDD format (common from yt-dlp)
+    if len(date_str) == 8 and date_str.isdigit():
+        return f"{date_str[:4]}-{date_str[4:6]}-{date_str[6:]}"
 
+    # Other formats are returned unchanged
+    return date_str
 
-class StreamlitProgressHook:
-    """Progress hook for Streamlit interface."""
 
-    def __init__(self, progress_bar, status_text):
-        self.progress_bar = progress_bar
-        self.status_text = status_text
-        self.last_percent = 0
+_INV_MB = 1.0 / (1024 * 1024)
+
+
+class StreamlitProgressHook:
+    """
+    Progress hook for Streamlit interface.
+    Called from the download thread(s), so it never touches widgets: updates
+    go through a single-slot queue that drops unread values, and the script
+    thread renders the newest one via `snapshot()`. Progress is aggregated
+    over all files, so parallel playlist downloads report a single percentage;
+    entries that haven't started yet are counted at the average size of those
+    that have, so the bar doesn't jump back each time a new video starts.
+    """
+
+    # Minimum seconds between updates while the percentage is unchanged
+    MIN_UPDATE_INTERVAL = 0.1
+
+    def __init__(self):
+        self.last_percent = -1
+        self.last_update_ts = 0.0
+        self.updates: queue.Queue = queue.Queue(maxsize=1)
+        self.latest = (0, "🚀 Starting download...")  # Last update read by the script thread
+        self.files: Dict[str, Tuple[int, int]] = {}  # filename -> (downloaded, total)
+        self.entries: set = set()  # Playlist entries (or files) that have started
+        self.n_entries = 0  # Playlist size when known
+        self._lock = threading.Lock()
+
+    def snapshot(self) -> Tuple[int, str]:
+        """Return the latest (percent, status message) pair."""
+        try:
+            self.latest = self.updates.get_nowait()
+        except queue.Empty:
+            pass
+        return self.latest
+
+    def _publish(self, percent: int, message: str):
+        """Hand an update to the script thread, replacing any unread one."""
+        while True:
+            try:
+                self.updates.put_nowait((percent, message))
+                return
+            except queue.Full:
+                try:
+                    self.updates.get_nowait()
+                except queue.Empty:
+                    pass
+
+    def _totals(self) -> Tuple[int, int, float]:
+        """
+        Sum downloaded and total bytes over all tracked files, plus the overall
+        percentage with not-yet-started playlist entries estimated (lock held).
+        """
+        downloaded = total = 0
+        for file_downloaded, file_total in self.files.values():
+            downloaded += file_downloaded
+            total += file_total
+        if not total:
+            return downloaded, total, 0.0
+        started = len(self.entries)
+        percent = downloaded * 100 * started / (total * max(self.n_entries, started))
+        return downloaded, total, min(percent, 100.0)  # Estimates can overshoot
+
+    def _track(self, d):
+        """Note which playlist entry a progress dict belongs to (lock held)."""
+        info = d.get('info_dict') or {}
+        self.n_entries = max(self.n_entries, info.get('n_entries') or 0)
+        index = info.get('playlist_index')
+        self.entries.add(index if index is not None else d.get('filename'))
 
     def __call__(self, d):
         if d['status'] == 'downloading':
-            if 'total_bytes' in d:
-                percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
-                downloaded_mb = d['downloaded_bytes'] / (1024 * 1024)
-                total_mb = d['total_bytes'] / (1024 * 1024)
-            elif 'total_bytes_estimate' in d:
-                percent = (d['downloaded_bytes'] / d['total_bytes_estimate']) * 100
-                downloaded_mb = d['downloaded_bytes'] / (1024 * 1024)
-                total_mb = d['total_bytes_estimate'] / (1024 * 1024)
-            else:
+            file_total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            if not file_total:
+                return
+            with self._lock:
+                self._track(d)
+                self.files[d.get('filename')] = (d['downloaded_bytes'], file_total)
+                downloaded, total, percent = self._totals()
+                started, n_entries = len(self.entries), self.n_entries
+
+            # Skip widget updates that would only resend the same frame
+            now = time.monotonic()
+            current_percent = int(percent)
+            if current_percent == self.last_percent and now - self.last_update_ts < self.MIN_UPDATE_INTERVAL:
                 return
+            self.last_percent = current_percent
+            self.last_update_ts = now
 
-            # Update progress bar and status
-            self.progress_bar.progress(int(percent))
-            self.status_text.text(f"Downloading... {percent:.1f}% ({downloaded_mb:.1f}MB / {total_mb:.1f}MB)")
+            # Update progress and status
+            message = f"Downloading... {percent:.1f}% ({downloaded * _INV_MB:.1f}MB / {total * _INV_MB:.1f}MB"
+            if n_entries > 1:
+                message += f", {min(started, n_entries)} of {n_entries} videos started"
+            self._publish(current_percent, message + ")")
 
         elif d['status'] == 'finished':
-            filename = Path(d['filename']).name
-            self.progress_bar.progress(100)
-            self.status_text.text(f"✅ Download completed: {filename}")
+            filename = d['filename']
+            with self._lock:
+                if filename in self.files:
+                    file_total = self.files[filename][1]
+                    self.files[filename] = (file_total, file_total)
+                _, total, percent = self._totals()
+            percent = int(percent) if total else 100
+            self.last_percent = percent
+            self._publish(percent, f"✅ Download completed: {Path(filename).name}")
 
         elif d['status'] == 'error':
-            self.status_text.text(f"❌ Error: {d.get('error', 'Unknown error')}")
+            self._publish(max(self.last_percent, 0), f"❌ Error: {d.get('error', 'Unknown error')}")
+
+
+@st.cache_data(max_entries=512, show_spinner=False)
+def _validate(url: str) -> Tuple[bool, str]:
+    """Validate a URL non-interactively, memoized per unique input."""
+    return URLValidator.validate_url(url, interactive=False)
+
+
+def validate_url(url: str) -> Tuple[bool, str]:
+    """Validate a URL, keeping only successful results cached."""
+    is_valid, processed_url = _validate(url)
+    if not is_valid:
+        # A failed yt-dlp probe may be a transient network error, so check again next time
+        _validate.clear(url)
+    return is_valid, processed_url
+
+
+@st.cache_data(ttl=3600, max_entries=256, show_spinner=False)
+def _fetch_video_info(url: str) -> Optional[Dict[str, Any]]:
+    """Fetch video information, memoized across reruns and sessions."""
+    return URLValidator.get_video_info(url)
 
 
 def get_video_info(url: str) -> Optional[Dict[str, Any]]:
@@ -164,18 +259,219 @@ def get_video_info(url: str) -> Optional[Dict[str, Any]]:
     if not url:
         return None
 
-    # Use session state for caching
-    cache_key = f"video_info_{hash(url)}"
-    if cache_key in st.session_state:
-        return st.session_state[cache_key]
-
     with st.spinner("🔍 Getting video information..."):
-        info = URLValidator.get_video_info(url)
-        if info:
-            st.session_state[cache_key] = info
+        info = _fetch_video_info(url)
+        if not info:
+            # Don't keep failed lookups around, so a retry hits yt-dlp again
+            _fetch_video_info.clear(url)
         return info
 
 
+@st.cache_resource
+def _get_executor() -> ThreadPoolExecutor:
+    """Thread pool for downloads, shared across reruns and sessions."""
+    return ThreadPoolExecutor(max_workers=2, thread_name_prefix="download")
+
+
+@st.fragment(run_every=0.25)
+def download_progress():
+    """Poll the running download and render its progress."""
+    future = st.session_state.download_future
+    percent, message = st.session_state.progress_hook.snapshot()
+    st.progress(percent)
+    st.text(message)
+
+    if not future.done():
+        return
+
+    # YouTubeDownloader.download reports failures by returning False, so anything
+    # raised here (e.g. a cancelled future) is unexpected and shown as is
+    success, error = False, None
+    try:
+        success = future.result()
+    except Exception as e:
+        error = str(e) or type(e).__name__
+
+    # Reset before rerunning, so the button never stays disabled
+    st.session_state.download_future = None
+    st.session_state.progress_hook = None
+    st.session_state.download_status = {
+        'success': success,
+        'error': error,
+        'output_dir': st.session_state.download_dir,
+    }
+    st.session_state.is_downloading = False
+    st.rerun()
+
+
+def render_download_status(status: Dict[str, Any]):
+    """Show the outcome of the last finished download."""
+    if status['error']:
+        st.error(f"❌ Error during download: {status['error']}")
+    elif status['success']:
+        st.markdown(f"""
+        <div class="success-box">
+            <h4>✅ Download Completed Successfully!</h4>
+            <p><strong>📁 Files saved to:</strong> {os.path.abspath(status['output_dir'])}</p>
+        </div>
+        """, unsafe_allow_html=True)
+    else:
+        st.markdown("""
+        <div class="error-box">
+            <h4>❌ Download Failed</h4>
+            <p>Please check the URL, your internet connection, or try a different quality setting.</p>
+        </div>
+        """, unsafe_allow_html=True)
+
+
+def render_video_info(video_info: Dict[str, Any]):
+    """Display video information as a single element, plus a description expander."""
+    title = html.escape(str(video_info.get('title', 'Unknown')))
+    uploader = html.escape(str(video_info.get('uploader', 'Unknown')))
+    duration = format_duration(video_info.get('duration', 0))
+    view_count = video_info.get('view_count') or 'Unknown'
+    upload_date = html.escape(format_upload_date(video_info.get('upload_date', 'Unknown')))
+    description = video_info.get('description') or ''
+
+    st.markdown(f"""
+    <div class="info-box">
+        <h3>📺 Video Information</h3>
+        <div class="info-grid">
+            <div><strong>Title:</strong> {title}</div>
+            <div><strong>Views:</strong> {view_count}</div>
+            <div><strong>Uploader:</strong> {uploader}</div>
+            <div><strong>Upload Date:</strong> {upload_date}</div>
+            <div><strong>Duration:</strong> {duration}</div>
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    if description:
+        with st.expander("📄 Description"):
+            st.write(description[:500] + "..." if len(description) > 500 else description)
+
+
+# Matches playlist URLs ('.../playlist?list=...' or any '&list=' parameter)
+_PLAYLIST_RE = re.compile(r'playlist|list=', re.IGNORECASE)
+
+# (label, value) pairs for the download option selectboxes
+_QUALITY_CHOICES = (
+    ("Best Quality", Quality.BEST),
+    ("4K (2160p)", Quality.HD_4K),
+    ("HD (1080p)", Quality.HD_1080),  # Default
+    ("HD (720p)", Quality.HD_720),
+    ("Audio Only (MP3)", Quality.AUDIO_ONLY),
+)
+
+_FORMAT_CHOICES = (
+    ("Original (from YouTube)", None),  # Let yt-dlp choose
+    ("MP4 (Best Compatibility)", VideoFormat.MP4),  # Default
+    ("WebM (Smaller Size)", VideoFormat.WEBM),
+    ("MKV (High Quality)", VideoFormat.MKV),
+)
+
+
+@st.fragment
+def options_panel(url: str, video_info: Optional[Dict[str, Any]]):
+    """
+    Download options column.
+    Runs as a fragment so changing an option only reruns this panel, not URL
+    validation and the info panel. The chosen options are published to
+    session state for the download button.
+    """
+    st.subheader("⚙️ Download Options")
+
+    # Quality selection
+    _, quality = st.selectbox(
+        "Video Quality",
+        options=_QUALITY_CHOICES,
+        format_func=itemgetter(0),
+        index=2,  # Default to HD 1080p
+        help="Choose the video quality for download"
+    )
+
+    # Format selection (only for video downloads)
+    if quality != Quality.AUDIO_ONLY:
+        _, video_format = st.selectbox(
+            "Video Format",
+            options=_FORMAT_CHOICES,
+            format_func=itemgetter(0),
+            index=1,  # Default to MP4
+            help="Choose output video format"
+        )
+        force_convert = video_format is not None  # Original keeps yt-dlp's choice
+    else:
+        video_format = VideoFormat.MP4  # Not used for audio
+        force_convert = False
+
+    embed_metadata = False
+    if quality != Quality.AUDIO_ONLY:
+        embed_metadata = st.checkbox(
+            "Embed metadata",
+            value=False,
+            help="Write title and uploader tags into the file (takes an extra pass over it)"
+        )
+
+    # Parallel fragment downloads for DASH/HLS streams
+    concurrent_fragments = st.slider(
+        "Concurrent fragments",
+        min_value=1,
+        max_value=16,
+        value=4,
+        help="Number of stream fragments to download in parallel"
+    )
+
+    # Output directory
+    output_dir = st.text_input(
+        "Output Directory",
+        value=st.session_state.default_output_dir,
+        help="Directory where files will be saved"
+    )
+
+    # Custom filename
+    suggested_filename = ""
+    if video_info and video_info.get('title'):
+        suggested_filename = clean_filename(video_info['title'])
+
+    custom_filename = st.text_input(
+        "Custom Filename (optional)",
+        value=suggested_filename,
+        placeholder=suggested_filename,
+        help="Leave empty to use video title as filename"
+    )
+
+    # Playlist option, checked by default for playlist URLs
+    is_playlist = st.checkbox(
+        "Download as playlist",
+        value=bool(url) and _PLAYLIST_RE.search(url) is not None,
+        help="Download all videos if it's a playlist; otherwise, attempt to treat as one if available"
+    )
+
+    # Parallel playlist downloads
+    playlist_workers = 1
+    if is_playlist:
+        playlist_workers = st.slider(
+            "Parallel videos",
+            min_value=1,
+            max_value=8,
+            value=4,
+            help="Number of playlist videos to download at the same time"
+        )
+
+    # Publish the choices for the download button outside this fragment
+    st.session_state.download_options = {
+        'quality': quality,
+        'video_format': video_format,
+        'force_convert': force_convert,
+        'embed_metadata': embed_metadata,
+        'concurrent_fragments': concurrent_fragments,
+        'output_dir': output_dir,
+        'custom_filename': custom_filename,
+        'is_playlist': is_playlist,
+        'playlist_workers': playlist_workers,
+    }
+
+
 def main():
     """Main Streamlit application."""
     initialize_session_state()
@@ -192,7 +488,6 @@ def main():
     col1, col2 = st.columns([2, 1])
 
     with col1:
-        st.markdown('<div class="download-section">', unsafe_allow_html=True)
         st.subheader("📥 Download Video")
 
         # URL input
@@ -205,132 +500,18 @@ def main():
         # Validate URL and get info
         video_info = None
         if url:
-            is_valid, processed_url = URLValidator.validate_url(url, interactive=False)
+            is_valid, processed_url = validate_url(url)
             if is_valid:
                 video_info = get_video_info(processed_url)
                 url = processed_url  # Use processed URL
 
                 if video_info:
-                    # Display video information
-                    st.markdown('<div class="info-box">', unsafe_allow_html=True)
-                    st.markdown("### 📺 Video Information")
-
-                    col_info1, col_info2 = st.columns(2)
-                    with col_info1:
-                        st.write(f"**Title:** {video_info.get('title', 'Unknown')}")
-                        st.write(f"**Uploader:** {video_info.get('uploader', 'Unknown')}")
-                        st.write(f"**Duration:** {format_duration(video_info.get('duration', 0))}")
-
-                    with col_info2:
-                        # Display views without comma formatting
-                        view_count = video_info.get('view_count')
-                        if view_count:
-                            st.write(f"**Views:** {view_count}")
-                        else:
-                            st.write("**Views:** Unknown")
-
-                        # Format upload date to YYYY-MM-DD
-                        upload_date = format_upload_date(video_info.get('upload_date', 'Unknown'))
-                        st.write(f"**Upload Date:** {upload_date}")
-
-                        if video_info.get('description'):
-                            with st.expander("📄 Description"):
-                                st.write(video_info['description'][:500] + "..." if len(video_info['description']) > 500 else video_info['description'])
-
-                    st.markdown('</div>', unsafe_allow_html=True)
+                    render_video_info(video_info)
             else:
                 st.error("❌ Invalid YouTube URL. Please check the URL and try again.")
 
-        st.markdown('</div>', unsafe_allow_html=True)
-
     with col2:
-        st.subheader("⚙️ Download Options")
-
-        # Quality selection
-        quality_options = {
-            "Best Quality": Quality.BEST,
-            "4K (2160p)": Quality.HD_4K,
-            "HD (1080p)": Quality.HD_1080,  # Default
-            "HD (720p)": Quality.HD_720,
-            "Audio Only (MP3)": Quality.AUDIO_ONLY
-        }
-
-        selected_quality = st.selectbox(
-            "Video Quality",
-            options=list(quality_options.keys()),
-            index=2,  # Default to HD 1080p
-            help="Choose the video quality for download"
-        )
-        quality = quality_options[selected_quality]
-
-        # Format selection (only for video downloads)
-        if quality != Quality.AUDIO_ONLY:
-            format_options = {
-                "Original (from YouTube)": None,  # Let yt-dlp choose
-                "MP4 (Best Compatibility)": VideoFormat.MP4,
-                "WebM (Smaller Size)": VideoFormat.WEBM,
-                "MKV (High Quality)": VideoFormat.MKV
-            }
-
-            selected_format = st.selectbox(
-                "Video Format",
-                options=list(format_options.keys()),
-                index=1,  # Default to MP4
-                help="Choose output video format"
-            )
-            video_format = format_options[selected_format]
-            force_convert = selected_format != "Original (from YouTube)"
-        else:
-            video_format = VideoFormat.MP4  # Not used for audio
-            force_convert = False
-
-        # Output directory
-        current_dir = os.getcwd()
-        output_dir = st.text_input(
-            "Output Directory",
-            value=current_dir,
-            help="Directory where files will be saved"
-        )
-
-        # Custom filename
-        suggested_filename = ""
-        if video_info and video_info.get('title'):
-            suggested_filename = clean_filename(video_info['title'])
-
-        custom_filename = st.text_input(
-            "Custom Filename (optional)",
-            value=suggested_filename,
-            placeholder=suggested_filename,
-            help="Leave empty to use video title as filename"
-        )
-
-        # Playlist option
-        is_playlist = False
-        if url and ('playlist' in url.lower() or 'list=' in url):
-            is_playlist = st.checkbox(
-                "Download entire playlist",
-                value=True,
-                help="Download all videos in the playlist"
-            )
-        else:
-            is_playlist = st.checkbox(
-                "Download as playlist",
-                value=False,
-                help="Attempt to download as playlist if available"
-            )
-
-        # # # Playlist option
-        # if url and ('playlist' in url.lower() or 'list=' in url):
-        #     default_value = True
-        # else:
-        #     default_value = False
-
-        # is_playlist = st.checkbox(
-        #     "Download as playlist",
-        #     value=default_value,
-        #     key="playlist_checkbox",  # Optional: Ensures unique state tracking
-        #     help="Download all videos if it's a playlist; otherwise, attempt to treat as one if available"
-        # )
+        options_panel(url, video_info)
 
     # Download section
     st.markdown("---")
@@ -349,68 +530,49 @@ def main():
         with col_btn2:
             if st.button("🔄 Refresh Info", help="Reload video information"):
                 # Clear cache and reload
-                cache_key = f"video_info_{hash(url)}"
-                if cache_key in st.session_state:
-                    del st.session_state[cache_key]
+                _fetch_video_info.clear(url)
+                URLValidator.invalidate(url)
                 st.rerun()
 
         # Download process
         if download_btn and not st.session_state.is_downloading:
-            st.session_state.is_downloading = True
-
-            # Create output directory
-            Path(output_dir).mkdir(parents=True, exist_ok=True)
-
-            # Progress indicators
-            progress_bar = st.progress(0)
-            status_text = st.empty()
+            options = st.session_state.download_options
+
+            # Create downloader (and its output directory) with custom progress hook
+            progress_hook = StreamlitProgressHook()
+            downloader = YouTubeDownloader(
+                output_dir=options['output_dir'],
+                custom_filename=options['custom_filename'] if options['custom_filename'] else None,
+                preferred_format=options['video_format'] if options['video_format'] else VideoFormat.MP4,
+                progress_callback=progress_hook,
+                concurrent_fragments=options['concurrent_fragments'],
+                playlist_workers=options['playlist_workers'],
+                embed_metadata=options['embed_metadata']
+            )
 
-            try:
-                # Create downloader with custom progress hook
-                progress_hook = StreamlitProgressHook(progress_bar, status_text)
-                downloader = YouTubeDownloader(
-                    output_dir=output_dir,
-                    custom_filename=custom_filename if custom_filename else None,
-                    preferred_format=video_format if video_format else VideoFormat.MP4
-                )
-
-                # Replace the progress hook
-                downloader.progress_hook = progress_hook
-
-                # Start download
-                status_text.text("🚀 Starting download...")
-                success = downloader.download(
-                    url=url,
-                    quality=quality,
-                    is_playlist=is_playlist,
-                    video_info=video_info,
-                    force_convert=force_convert
-                )
-
-                if success:
-                    st.markdown(f"""
-                    <div class="success-box">
-                        <h4>✅ Download Completed Successfully!</h4>
-                        <p><strong>📁 Files saved to:</strong> {os.path.abspath(output_dir)}</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-                else:
-                    st.markdown("""
-                    <div class="error-box">
-                        <h4>❌ Download Failed</h4>
-                        <p>Please check the URL, your internet connection, or try a different quality setting.</p>
-                    </div>
-                    """, unsafe_allow_html=True)
-
-            except Exception as e:
-                st.error(f"❌ Error during download: {str(e)}")
-
-            finally:
-                st.session_state.is_downloading = False
+            # Start download in the background so the script thread stays free
+            st.session_state.download_future = _get_executor().submit(
+                downloader.download,
+                url=url,
+                quality=options['quality'],
+                is_playlist=options['is_playlist'],
+                video_info=video_info,
+                force_convert=options['force_convert']
+            )
+            st.session_state.progress_hook = progress_hook
+            st.session_state.download_dir = options['output_dir']
+            st.session_state.download_status = None
+            st.session_state.is_downloading = True
+            st.rerun()
 
     elif url and not video_info:
         st.warning("⚠️ Could not retrieve video information. Please check the URL.")
 
+    if st.session_state.download_future is not None:
+        download_progress()
+    elif st.session_state.download_status is not None:
+        render_download_status(st.session_state.download_status)
+
 
 if __name__ == "__main__":
     main()
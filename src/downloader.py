@@ -4,22 +4,132 @@ A clean, fast YouTube downloader optimized for GUI integration.
 """
 
 import os
+import shutil
 import sys
-import argparse
+import atexit
 import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional, Dict, Any, Tuple, Callable
-import yt_dlp
+from typing import TYPE_CHECKING, Optional, Dict, Any, Tuple, Callable, Iterator, List
+
+# yt_dlp (and argparse for the CLI) are imported where used: importing yt_dlp
+# loads every extractor, which --help and early exits never need.
+if TYPE_CHECKING:
+    import yt_dlp
+
+
+# Range request size for chunked HTTP downloads (10 MiB)
+HTTP_CHUNK_SIZE = 10 * 1024 * 1024
+
+# Parallel DASH/HLS fragment downloads unless told otherwise
+DEFAULT_CONCURRENT_FRAGMENTS = min(os.cpu_count() or 4, 8)
+
+# YouTube extractor args that skip fetching and parsing DASH/HLS manifests
+SKIP_MANIFESTS = {'youtube': {'skip': ['dash', 'hls']}}
+
+# Options shared by every YoutubeDL instance. A fixed cache dir lets all
+# instances reuse yt-dlp's cached player JS and signature functions.
+# Metadata lookups override socket_timeout with a shorter one.
+BASE_YDL_OPTS = {
+    'cachedir': str(Path.home() / '.cache' / 'yt_dl_downloader'),
+    'socket_timeout': 10,  # Fail over instead of stalling on an unresponsive CDN host
+    'retries': 3,
+    'fragment_retries': 10,
+}
+
+# Idle YoutubeDL instances for metadata lookups, keyed by their options
+_session_pool: Dict[str, List['yt_dlp.YoutubeDL']] = {}
+_session_pool_lock = threading.Lock()
+
+# Idle instances kept per options key; extras are closed when returned
+MAX_IDLE_SESSIONS = 8
+
+
+@contextmanager
+def _session(opts: Dict[str, Any]) -> Iterator['yt_dlp.YoutubeDL']:
+    """
+    Check out a pooled YoutubeDL for metadata lookups with the given options.
+    Reusing an instance skips re-initialisation and keeps its HTTP connections
+    alive between lookups, whichever thread makes them. An instance is only
+    used by one thread at a time since YoutubeDL isn't thread-safe, and
+    downloads still get their own instance because hooks and postprocessors
+    are only registered at construction.
+    """
+    import yt_dlp
+
+    key = repr(sorted(opts.items()))
+    with _session_pool_lock:
+        idle = _session_pool.setdefault(key, [])
+        ydl = idle.pop() if idle else None
+    if ydl is None:
+        ydl = yt_dlp.YoutubeDL(opts)
+
+    try:
+        yield ydl
+    finally:
+        with _session_pool_lock:
+            idle = _session_pool[key]
+            if len(idle) < MAX_IDLE_SESSIONS:
+                idle.append(ydl)
+                ydl = None
+        if ydl is not None:
+            ydl.close()
+
+
+@atexit.register
+def _close_sessions():
+    """Close pooled session instances at exit."""
+    with _session_pool_lock:
+        idle = [ydl for instances in _session_pool.values() for ydl in instances]
+        _session_pool.clear()
+    for ydl in idle:
+        ydl.close()
+
+
+# aria2c: 16 connections per file, 1 MiB pieces, no preallocation
+ARIA2C_ARGS = ['-x', '16', '-s', '16', '-k', '1M', '--file-allocation=none']
+
+
+# Translation table that strips characters invalid in filenames
+_INVALID_FS_CHARS = str.maketrans('', '', '<>:"/\\|?*')
+
+
+@lru_cache(maxsize=256)
+def clean_filename(filename: str) -> str:
+    """Clean filename for safe file system usage."""
+    # Remove invalid filename characters and limit length
+    return filename.translate(_INVALID_FS_CHARS).strip()[:100]
 
 
 class Quality(Enum):
-    """Video quality options with format preferences."""
-    BEST = "best[ext=mp4]/best"
-    HD_4K = "best[height<=2160][ext=mp4]/bestvideo[height<=2160]+bestaudio[ext=m4a]/best[height<=2160]"
-    HD_1080 = "best[height<=1080][ext=mp4]/bestvideo[height<=1080]+bestaudio[ext=m4a]/best[height<=1080]"
-    HD_720 = "best[height<=720][ext=mp4]/bestvideo[height<=720]+bestaudio[ext=m4a]/best[height<=720]"
-    AUDIO_ONLY = "bestaudio"
+    """Video quality options with format preferences.
+
+    Each value is a ``(default, force_convert)`` pair of format selectors:
+    the default prefers MP4 so no conversion is needed, while the
+    force_convert selector takes any container since we convert anyway.
+    """
+    BEST = (
+        "best[ext=mp4]/bestvideo[ext=mp4]+bestaudio[ext=m4a]/best",
+        "best",
+    )
+    HD_4K = (
+        "best[height<=2160][ext=mp4]/bestvideo[height<=2160][ext=mp4]+bestaudio[ext=m4a]/best[height<=2160]",
+        "bestvideo[height<=2160]+bestaudio/best[height<=2160]",
+    )
+    HD_1080 = (
+        "best[height<=1080][ext=mp4]/bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/best[height<=1080]",
+        "bestvideo[height<=1080]+bestaudio/best[height<=1080]",
+    )
+    HD_720 = (
+        "best[height<=720][ext=mp4]/bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/best[height<=720]",
+        "bestvideo[height<=720]+bestaudio/best[height<=720]",
+    )
+    AUDIO_ONLY = ("bestaudio/best", "bestaudio")
 
 
 class VideoFormat(Enum):
@@ -30,53 +140,120 @@ class VideoFormat(Enum):
     AVI = "avi"
 
 
+# Accepted answers for yes/no prompts
+_YES = frozenset({'y', 'yes'})
+_NO = frozenset({'n', 'no'})
+
+
+def get_yes_no(prompt: str, default: Optional[bool] = None) -> bool:
+    """
+    Ask a yes/no question until answered.
+    An empty answer returns default, or asks again if there is none.
+    """
+    while True:
+        choice = input(prompt).strip().lower()
+        if choice in _YES:
+            return True
+        if choice in _NO:
+            return False
+        if not choice and default is not None:
+            return default
+        print("Please enter 'y' or 'n'")
+
+
+# Console progress bar width, and every possible bar indexed by filled cells
+BAR_LENGTH = 30
+_PROGRESS_BARS = tuple('█' * i + '░' * (BAR_LENGTH - i) for i in range(BAR_LENGTH + 1))
+
+
 class DefaultProgressHook:
     """Default console progress display for downloads."""
 
-    def __init__(self):
-        self.last_printed_percent = -1
+    # Minimum seconds between redraws, to keep terminal output cheap
+    MIN_UPDATE_INTERVAL = 0.1
+
+    def __init__(self, show_bar: bool = True):
+        self.last_update_ts = 0.0
         self.current_stage = "Downloading"
+        # Parallel downloads would fight over one '\r' line, so they only report finished files
+        self.show_bar = show_bar
+        # Write progress lines as bytes, bypassing the text layer, when stdout has a buffer
+        self._buffer = getattr(sys.stdout, 'buffer', None)
+        self._encoding = sys.stdout.encoding or 'utf-8'
+        self._text_flushed = False
+
+    def _write(self, line: str):
+        """Write a progress line straight to stdout's byte buffer if available."""
+        if self._buffer is None:
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            return
+
+        if not self._text_flushed:
+            # Earlier print() output must land before our bytes
+            sys.stdout.flush()
+            self._text_flushed = True
+        self._buffer.write(line.encode(self._encoding, 'replace'))
+        self._buffer.flush()
 
     def __call__(self, d):
         if d['status'] == 'downloading':
-            if 'total_bytes' in d:
-                percent = (d['downloaded_bytes'] / d['total_bytes']) * 100
-            elif 'total_bytes_estimate' in d:
-                percent = (d['downloaded_bytes'] / d['total_bytes_estimate']) * 100
-            else:
+            if not self.show_bar:
                 return
+            now = time.monotonic()
+            if now - self.last_update_ts < self.MIN_UPDATE_INTERVAL:
+                return
+
+            total = d.get('total_bytes') or d.get('total_bytes_estimate')
+            if not total:
+                return
+            percent = min(d['downloaded_bytes'] * 100 / total, 100.0)  # Estimates can overshoot
 
-            # Only update every 2% to reduce terminal spam
-            current_percent = int(percent)
-            if current_percent != self.last_printed_percent and current_percent % 2 == 0:
-                self.last_printed_percent = current_percent
-                bar_length = 30
-                filled_length = int(bar_length * percent / 100)
-                bar = '█' * filled_length + '░' * (bar_length - filled_length)
-                print(f"\r{self.current_stage}: [{bar}] {percent:.1f}%", end='', flush=True)
+            self.last_update_ts = now
+            bar = _PROGRESS_BARS[int(percent * BAR_LENGTH / 100)]
+            self._write(f"\r{self.current_stage}: [{bar}] {percent:.1f}%")
 
         elif d['status'] == 'finished':
-            print(f"\n✓ Downloaded: {Path(d['filename']).name}")
+            name = Path(d['filename']).name
+            if not self.show_bar:
+                # One write per line, so lines from parallel downloads don't interleave
+                self._write(f"✓ Downloaded: {name}\n")
+                return
+            # The throttle may have skipped the last redraw, so always end on a full bar
+            self._write(f"\r{self.current_stage}: [{_PROGRESS_BARS[-1]}] 100.0%")
+            print(f"\n✓ Downloaded: {name}")
+            self._text_flushed = False
 
         elif d['status'] == 'error':
             print(f"\n❌ Error during download: {d.get('error', 'Unknown error')}")
+            self._text_flushed = False
 
 
 class URLValidator:
     """Validate and extract video information from URLs with flexible handling."""
 
-    YOUTUBE_PATTERNS = [
-        r'(?:https?://)?(?:www\.)?youtube\.com/watch\?v=[\w-]+',
-        r'(?:https?://)?(?:www\.)?youtube\.com/playlist\?list=[\w-]+',
-        r'(?:https?://)?youtu\.be/[\w-]+',
-        r'(?:https?://)?(?:www\.)?youtube\.com/c/[\w-]+',
-        r'(?:https?://)?(?:www\.)?youtube\.com/channel/[\w-]+',
-        r'(?:https?://)?(?:www\.)?youtube\.com/@[\w-]+',
-        r'(?:https?://)?(?:music\.)?youtube\.com/[\w/?=&-]+',
-        r'(?:https?://)?(?:m\.)?youtube\.com/[\w/?=&-]+',
-        r'(?:https?://)?(?:www\.)?youtube\.com/embed/[\w-]+',
-        r'(?:https?://)?(?:www\.)?youtube\.com/shorts/[\w-]+',
-    ]
+    # Anchored and factored so each URL is scanned left to right once, with no
+    # overlapping alternatives to backtrack through.  match() only needs a
+    # prefix, so a single trailing id/path character is enough to accept.
+    _YOUTUBE_RE = re.compile(
+        r'(?:https?://)?'
+        r'(?:'
+        r'(?:(?:music|m)\.)?youtube\.com/[\w/?=&-]'
+        r'|(?:www\.)?youtube\.com/'
+        r'(?:watch\?v=|playlist\?list=|c/|channel/|@|embed/|shorts/)[\w-]'
+        r'|youtu\.be/[\w-]'
+        r')',
+        re.IGNORECASE,
+    )
+
+    # Seconds before a stalled metadata request gives up
+    SOCKET_TIMEOUT = 5
+
+    # Extracted info shared by the probe, confirmation and download steps:
+    # url -> (timestamp, is_flat, info)
+    INFO_CACHE_TTL = 300  # seconds
+    INFO_CACHE_MAX_ENTRIES = 256
+    _info_cache: Dict[str, Tuple[float, bool, Dict[str, Any]]] = {}
 
     @classmethod
     def validate_url(cls, url: str, interactive: bool = True) -> Tuple[bool, str]:
@@ -99,54 +276,97 @@ class URLValidator:
             print(f"❓ URL format not recognized: {url}")
             print("This might still be a valid YouTube link or supported video platform.")
 
-            while True:
-                choice = input("Try to download anyway? (y/n): ").strip().lower()
-                if choice in ['y', 'yes']:
-                    print("⚠️  Attempting download with unverified URL...")
-                    return True, url
-                elif choice in ['n', 'no']:
-                    return False, url
-                print("Please enter 'y' or 'n'")
+            if get_yes_no("Try to download anyway? (y/n): "):
+                print("⚠️  Attempting download with unverified URL...")
+                return True, url
+            return False, url
 
         return False, url
 
     @classmethod
     def _matches_youtube_pattern(cls, url: str) -> bool:
         """Check if URL matches known YouTube patterns."""
-        return any(re.match(pattern, url, re.IGNORECASE) for pattern in cls.YOUTUBE_PATTERNS)
+        return cls._YOUTUBE_RE.match(url) is not None
 
     @classmethod
     def _test_url_with_ydlp(cls, url: str) -> bool:
         """Test URL with yt-dlp to see if it's supported."""
         try:
             opts = {
+                **BASE_YDL_OPTS,
                 'quiet': True,
                 'no_warnings': True,
-                'extract_flat': True,  # Don't extract full info, just test
+                'extract_flat': 'in_playlist',  # Don't resolve playlist entries
+                'skip_download': True,
+                'socket_timeout': cls.SOCKET_TIMEOUT,
+                'extractor_args': SKIP_MANIFESTS,  # Manifests aren't needed to test a URL
             }
 
-            with yt_dlp.YoutubeDL(opts) as ydl:
-                info = ydl.extract_info(url, download=False)
-                return info is not None
+            with _session(opts) as ydl:
+                # process=False returns the raw extractor result, so entries are never walked
+                info = ydl.extract_info(url, download=False, process=False)
+            return info is not None
         except Exception:
             return False
 
     @classmethod
-    def get_video_info(cls, url: str, extract_flat: bool = False) -> Optional[Dict[str, Any]]:
+    def _get_cached_info(cls, url: str, extract_flat: bool) -> Optional[Dict[str, Any]]:
+        """Return cached info for URL if fresh and detailed enough for the request."""
+        entry = cls._info_cache.get(url)
+        if entry is None:
+            return None
+
+        timestamp, is_flat, info = entry
+        if time.monotonic() - timestamp > cls.INFO_CACHE_TTL:
+            cls._info_cache.pop(url, None)
+            return None
+
+        # A flat entry can't answer a full request; that needs a re-extraction
+        if is_flat and not extract_flat:
+            return None
+        return info
+
+    @classmethod
+    def _cache_info(cls, url: str, extract_flat: bool, info: Dict[str, Any]):
+        """Store extracted info, evicting the oldest entry when full."""
+        cls._info_cache.pop(url, None)
+        if len(cls._info_cache) >= cls.INFO_CACHE_MAX_ENTRIES:
+            cls._info_cache.pop(next(iter(cls._info_cache)), None)
+        cls._info_cache[url] = (time.monotonic(), bool(extract_flat), info)
+
+    @classmethod
+    def invalidate(cls, url: str):
+        """Drop cached info for URL, e.g. after a failed download."""
+        cls._info_cache.pop(url, None)
+
+    @classmethod
+    def get_video_info(cls, url: str, extract_flat: bool = False,
+                       silent: bool = False) -> Optional[Dict[str, Any]]:
         """Extract video information without downloading. Optimized for speed."""
+        info = cls._get_cached_info(url, extract_flat)
+        if info is not None:
+            return info
+
         try:
             opts = {
+                **BASE_YDL_OPTS,
                 'quiet': True,
                 'no_warnings': True,
-                'extract_flat': extract_flat,  # Fast extraction for GUI
+                # Playlist entries stay flat either way; resolving them one by one is
+                # what made playlist lookups take minutes
+                'extract_flat': extract_flat or 'in_playlist',
+                'socket_timeout': cls.SOCKET_TIMEOUT,
+                **({'extractor_args': SKIP_MANIFESTS} if extract_flat else {}),
                 #'noplaylist': False if is_playlist else True,  # Force single-video extraction
             }
 
-            with yt_dlp.YoutubeDL(opts) as ydl:
+            with _session(opts) as ydl:
                 info = ydl.extract_info(url, download=False)
-                return info
+            if info is not None:
+                cls._cache_info(url, extract_flat, info)
+            return info
         except Exception as e:
-            if not extract_flat:  # Don't print errors for GUI usage
+            if not extract_flat and not silent:  # Don't print errors for GUI usage
                 print(f"❌ Failed to get video info: {e}")
             return None
 
@@ -155,34 +375,69 @@ class URLValidator:
         """Fast video info extraction for GUI - gets basic info only."""
         return cls.get_video_info(url, extract_flat=False)
 
+    @classmethod
+    def get_playlist_entries(cls, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Enumerate playlist entries without resolving each video.
+        Returns the flat playlist info, or None if the URL is not a playlist.
+        """
+        # Same flat extraction as get_video_info, so a lookup made just before is reused
+        info = cls.get_video_info(url, silent=True)
+        if not info or info.get('_type') != 'playlist':
+            return None
+        # New dict and list, so the cached info stays as extracted
+        return {**info, 'entries': [entry for entry in info.get('entries') or [] if entry]}
+
 
 class YouTubeDownloader:
     """Main downloader class optimized for GUI integration."""
 
+    # Output directories already created by this process
+    _ensured_dirs: set = set()
+
     def __init__(self, output_dir: str = '.', custom_filename: Optional[str] = None,
                  preferred_format: Optional[VideoFormat] = None,
-                 progress_callback: Optional[Callable] = None):
+                 progress_callback: Optional[Callable] = None,
+                 concurrent_fragments: int = DEFAULT_CONCURRENT_FRAGMENTS, playlist_workers: int = 1,
+                 use_aria2c: bool = False, embed_metadata: bool = False):
         self.output_dir = Path(output_dir)
+        self._output_dir_str = str(self.output_dir)  # Reused by every output template
+        if self._output_dir_str not in self._ensured_dirs:
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            self._ensured_dirs.add(self._output_dir_str)
         self.custom_filename = custom_filename
         self.preferred_format = preferred_format or VideoFormat.MP4
         self.progress_hook = progress_callback or DefaultProgressHook()
+        self.concurrent_fragments = max(1, concurrent_fragments)
+        self.playlist_workers = max(1, playlist_workers)
+        self.use_aria2c = use_aria2c and shutil.which('aria2c') is not None  # Only if installed
+        self.embed_metadata = embed_metadata
 
     def _get_ydl_opts(self, quality: Quality, is_playlist: bool = False,
                       video_info: Optional[Dict] = None, force_convert: bool = False) -> dict:
         """Build yt-dlp options with format preferences and conversion."""
         opts = {
-            'outtmpl': self._get_output_template(is_playlist, video_info),
+            **BASE_YDL_OPTS,
+            'outtmpl': self._get_output_template(self._output_dir_str, self.custom_filename, is_playlist),
             'progress_hooks': [self.progress_hook],
             'no_warnings': True,
             'ignoreerrors': False,
             'extract_flat': False,  # We need full info for progress
             'merge_output_format': 'mp4',
+            'concurrent_fragment_downloads': self.concurrent_fragments,  # Parallel DASH/HLS fragments
+            'http_chunk_size': HTTP_CHUNK_SIZE,
         }
 
+        if self.use_aria2c:
+            opts.update({
+                'external_downloader': {'default': 'aria2c'},
+                'external_downloader_args': {'aria2c': ARIA2C_ARGS},
+            })
+
         # Handle audio-only downloads
         if quality == Quality.AUDIO_ONLY:
             opts.update({
-                'format': 'bestaudio/best',
+                'format': self._build_format_string(quality),
                 'postprocessors': [{
                     'key': 'FFmpegExtractAudio',
                     'preferredcodec': 'mp3',
@@ -195,6 +450,12 @@ class YouTubeDownloader:
         format_string = self._build_format_string(quality, force_convert)
         opts['format'] = format_string
 
+        # The default BEST selector prefers progressive/adaptive streams that YouTube
+        # lists without the DASH manifest. HLS is kept since live streams only offer it.
+        needs_adaptive = quality in (Quality.HD_4K, Quality.HD_1080, Quality.HD_720) or force_convert
+        if not needs_adaptive:
+            opts['extractor_args'] = {'youtube': {'skip': ['dash']}}
+
         # Add post-processors for format conversion if needed
         postprocessors = []
 
@@ -203,11 +464,15 @@ class YouTubeDownloader:
                 'key': 'FFmpegVideoConvertor',
                 'preferedformat': self.preferred_format.value,
             })
+            # Re-encoding to H.264 dominates conversion time; trade a little size for speed
+            if self.preferred_format in (VideoFormat.MP4, VideoFormat.MKV):
+                opts['postprocessor_args'] = {'videoconvertor': ['-preset', 'veryfast']}
 
-        # Add metadata processor (optional for speed)
-        postprocessors.append({
-            'key': 'FFmpegMetadata',
-        })
+        # Metadata embedding rewrites the whole file, so only on request
+        if self.embed_metadata:
+            postprocessors.append({
+                'key': 'FFmpegMetadata',
+            })
 
         if postprocessors:
             opts['postprocessors'] = postprocessors
@@ -216,49 +481,16 @@ class YouTubeDownloader:
 
     def _build_format_string(self, quality: Quality, force_convert: bool = False) -> str:
         """Build format selection string prioritizing compatibility."""
-        if force_convert:
-            # If forcing conversion, we can accept any format since we'll convert
-            base_formats = {
-                Quality.BEST: "best",
-                Quality.HD_4K: "bestvideo[height<=2160]+bestaudio/best[height<=2160]",
-                Quality.HD_1080: "bestvideo[height<=1080]+bestaudio/best[height<=1080]",
-                Quality.HD_720: "bestvideo[height<=720]+bestaudio/best[height<=720]",
-            }
-            return base_formats.get(quality, "best")
-
-        # Default: prefer MP4, fallback to other formats for speed
-        format_preferences = {
-            Quality.BEST: (
-                "best[ext=mp4]/"
-                "bestvideo[ext=mp4]+bestaudio[ext=m4a]/"
-                "best"
-            ),
-            Quality.HD_4K: (
-                "best[height<=2160][ext=mp4]/"
-                "bestvideo[height<=2160][ext=mp4]+bestaudio[ext=m4a]/"
-                "best[height<=2160]"
-            ),
-            Quality.HD_1080: (
-                "best[height<=1080][ext=mp4]/"
-                "bestvideo[height<=1080][ext=mp4]+bestaudio[ext=m4a]/"
-                "best[height<=1080]"
-            ),
-            Quality.HD_720: (
-                "best[height<=720][ext=mp4]/"
-                "bestvideo[height<=720][ext=mp4]+bestaudio[ext=m4a]/"
-                "best[height<=720]"
-            )
-        }
+        return quality.value[1 if force_convert else 0]
 
-        return format_preferences.get(quality, "best[ext=mp4]/best")
-
-    def _get_output_template(self, is_playlist: bool = False, video_info: Optional[Dict] = None) -> str:
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _get_output_template(base_dir: str, custom_filename: Optional[str] = None,
+                             is_playlist: bool = False) -> str:
         """Generate output filename template."""
-        base_dir = str(self.output_dir)
-
-        if self.custom_filename and not is_playlist:
+        if custom_filename and not is_playlist:
             # Custom filename for single video
-            name_without_ext = Path(self.custom_filename).stem
+            name_without_ext = Path(custom_filename).stem
             return f"{base_dir}/{name_without_ext}.%(ext)s"
 
         if is_playlist:
@@ -268,10 +500,69 @@ class YouTubeDownloader:
         # Default: use video title
         return f"{base_dir}/%(title)s.%(ext)s"
 
+    @staticmethod
+    def _is_video_entry(entry: Dict[str, Any]) -> bool:
+        """Whether a flat playlist entry is a single video rather than a nested playlist."""
+        # Flat entries are url references; nested ones (e.g. channel tabs) come from YoutubeTab
+        return entry.get('_type', 'video') == 'video' or entry.get('ie_key') == 'Youtube'
+
+    def _download_playlist_parallel(self, playlist: Dict[str, Any], quality: Quality,
+                                    force_convert: bool = False, silent: bool = False) -> bool:
+        """
+        Download flat playlist entries concurrently, one yt-dlp run per video.
+        Returns False if any entry fails.
+        """
+        import yt_dlp
+
+        entries = playlist['entries']
+        # Mirror the '%(playlist)s/%(playlist_index)s - %(title)s' layout of serial downloads
+        playlist_dir = yt_dlp.utils.sanitize_filename(playlist.get('title') or playlist.get('id') or 'playlist')
+        base_dir = f"{self._output_dir_str}/{playlist_dir}".replace('%', '%%')
+        index_width = len(str(len(entries)))
+
+        def download_entry(index: int, entry: Dict[str, Any]) -> bool:
+            entry_url = entry.get('url') or entry['id']
+            opts = self._get_ydl_opts(quality, False, None, force_convert)
+            opts['outtmpl'] = f"{base_dir}/{index:0{index_width}d} - %(title)s.%(ext)s"
+            # yt-dlp's own '\r[download]' line would be shared by every worker
+            opts['noprogress'] = True
+            # Playlist position as in serial downloads, so progress hooks can see the entry count
+            playlist_fields = {'playlist_index': index, 'n_entries': len(entries)}
+            # Resolve through the shared info cache, so a retry skips re-extraction
+            info = URLValidator.get_video_info(entry_url, silent=silent)
+            with yt_dlp.YoutubeDL(opts) as ydl:
+                if info is None or info.get('_type', 'video') != 'video':
+                    # Unresolved, or a nested playlist: let yt-dlp walk it from the URL
+                    ydl.extract_info(entry_url, download=True, extra_info=playlist_fields)
+                    return True
+                # Same as --load-info-json: select formats and download from the extracted info.
+                # sanitize_info rebuilds every dict and list, but first sets defaults on the
+                # top-level one, so hand it a shallow copy to leave the cached info untouched.
+                info = {**ydl.sanitize_info(dict(info), remove_private_keys=True), **playlist_fields}
+                try:
+                    ydl.process_ie_result(info, download=True)
+                except (yt_dlp.utils.DownloadError, yt_dlp.utils.ReExtractInfo):
+                    # Cached info can go stale (e.g. expired stream URLs): extract afresh, as
+                    # --load-info-json does
+                    URLValidator.invalidate(entry_url)
+                    webpage_url = info.get('webpage_url')
+                    if webpage_url is None:
+                        raise
+                    ydl.extract_info(webpage_url, download=True, extra_info=playlist_fields)
+                return True
+
+        with ThreadPoolExecutor(max_workers=self.playlist_workers) as executor:
+            futures = [executor.submit(download_entry, index, entry)
+                       for index, entry in enumerate(entries, start=1)]
+            # result() re-raises the first failed entry's exception
+            return all(future.result() for future in futures)
+
     def download(self, url: str, quality: Quality, is_playlist: bool = False,
                  video_info: Optional[Dict] = None, force_convert: bool = False,
                  silent: bool = False) -> bool:
         """Download video(s) with specified quality and format conversion."""
+        import yt_dlp
+
         try:
             opts = self._get_ydl_opts(quality, is_playlist, video_info, force_convert)
 
@@ -294,11 +585,21 @@ class YouTubeDownloader:
                         mins, secs = divmod(duration, 60)
                         print(f"Duration: {mins:02d}:{secs:02d}")
 
+            if is_playlist and self.playlist_workers > 1:
+                playlist = URLValidator.get_playlist_entries(url)
+                entries = playlist['entries'] if playlist else None
+                if entries and all(map(self._is_video_entry, entries)):
+                    return self._download_playlist_parallel(playlist, quality, force_convert, silent)
+                # Not a flat list of videos (a single video, or e.g. a channel's tabs):
+                # download it in one run like any other URL
+
             with yt_dlp.YoutubeDL(opts) as ydl:
                 ydl.download([url])
                 return True
 
         except Exception as e:
+            # Cached info may be stale (e.g. expired stream URLs), so refetch next time
+            URLValidator.invalidate(url)
             if not silent:
                 print(f"❌ Download failed: {e}")
                 print("💡 Tips:")
@@ -356,22 +657,12 @@ class UserInterface:
                 print(f"   By: {uploader}")
 
                 # Confirm with user
-                while True:
-                    choice = input("Proceed with this video? (y/n): ").strip().lower()
-                    if choice in ['y', 'yes', '']:
-                        return processed_url
-                    elif choice in ['n', 'no']:
-                        break
-                    print("Please enter 'y' or 'n'")
+                if get_yes_no("Proceed with this video? (y/n): ", default=True):
+                    return processed_url
             else:
                 print("⚠️  Could not retrieve video information, but URL might still work.")
-                while True:
-                    choice = input("Try to download anyway? (y/n): ").strip().lower()
-                    if choice in ['y', 'yes']:
-                        return processed_url
-                    elif choice in ['n', 'no']:
-                        break
-                    print("Please enter 'y' or 'n'")
+                if get_yes_no("Try to download anyway? (y/n): "):
+                    return processed_url
 
     def get_quality_choice(self) -> Quality:
         """Present quality options and get user choice."""
@@ -412,16 +703,10 @@ class UserInterface:
         if format_choice == VideoFormat.MP4:
             print("\n🔄 Format conversion options:")
             print("YouTube often provides high-quality videos in WebM format.")
-            while True:
-                choice = input("Force conversion to MP4 even if it means re-encoding? (y/n) [default: n]: ").strip().lower()
-                if not choice or choice in ['n', 'no']:
-                    force_convert = False
-                    break
-                elif choice in ['y', 'yes']:
-                    force_convert = True
-                    print("⚠️  Note: This may take longer and slightly reduce quality")
-                    break
-                print("Please enter 'y' or 'n'")
+            force_convert = get_yes_no(
+                "Force conversion to MP4 even if it means re-encoding? (y/n) [default: n]: ", default=False)
+            if force_convert:
+                print("⚠️  Note: This may take longer and slightly reduce quality")
         else:
             force_convert = True  # Always convert for non-MP4 formats
 
@@ -438,11 +723,8 @@ class UserInterface:
         # Suggest filename based on video title if available
         suggested_filename = ""
         if video_info and video_info.get('title'):
-            # Clean up title for filename
-            title = video_info['title']
-            # Remove invalid filename characters
-            clean_title = re.sub(r'[<>:"/\\|?*]', '', title)
-            clean_title = clean_title.strip()[:50]  # Limit length
+            # Clean up title for filename: remove invalid characters, limit length
+            clean_title = video_info['title'].translate(_INVALID_FS_CHARS).strip()[:50]
             suggested_filename = f" [suggested: {clean_title}]"
 
         custom_filename = input(f"Custom filename (optional){suggested_filename}: ").strip()
@@ -453,28 +735,21 @@ class UserInterface:
         # Auto-detect playlist URLs
         if 'playlist' in url.lower() or 'list=' in url:
             print("🎵 Playlist detected!")
-            choice = input("Download entire playlist? (y/n) [default: n]: ").strip().lower()
-            if choice in ['y', 'yes']:
-                return True
-            return False
+            return get_yes_no("Download entire playlist? (y/n) [default: n]: ", default=False)
 
         # Check if video_info indicates a playlist
         if video_info and video_info.get('_type') == 'playlist':
             print("🎵 This URL contains a playlist!")
-            choice = input("Download entire playlist? (y/n) [default: n]: ").strip().lower()
-            if choice in ['y', 'yes']:
-                return True
-            return False
+            return get_yes_no("Download entire playlist? (y/n) [default: n]: ", default=False)
 
         # For non-playlist URLs, ask if they want to check for playlist
-        choice = input("\nDownload as playlist? (y/n) [default: n]: ").strip().lower()
-        if choice in ['y', 'yes']:
-            return True
-        return False
+        return get_yes_no("\nDownload as playlist? (y/n) [default: n]: ", default=False)
 
 
 def main():
     """Main application entry point for CLI usage."""
+    import argparse
+
     parser = argparse.ArgumentParser(
         description="Enhanced YouTube Downloader with format conversion support",
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -497,6 +772,14 @@ Examples:
     parser.add_argument("--force-convert", action="store_true",
                        help="Force conversion to specified format (may re-encode)")
     parser.add_argument("--playlist", "-p", action="store_true", help="Download entire playlist")
+    parser.add_argument("--concurrent-fragments", type=int, default=DEFAULT_CONCURRENT_FRAGMENTS, metavar="N",
+                       help=f"Fragments to download in parallel (default: {DEFAULT_CONCURRENT_FRAGMENTS})")
+    parser.add_argument("--playlist-workers", type=int, default=1, metavar="N",
+                       help="Playlist videos to download at once; above 1, converting one video "
+                            "overlaps with downloading the next (default: 1)")
+    parser.add_argument("--aria2c", action="store_true", help="Download with aria2c if it is installed")
+    parser.add_argument("--embed-metadata", action="store_true",
+                       help="Embed title/uploader metadata in the file (rewrites it once more)")
     parser.add_argument("--no-interactive", action="store_true", help="Skip interactive prompts")
     parser.add_argument("--force", action="store_true", help="Skip URL validation")
     parser.add_argument("--silent", action="store_true", help="Minimal output")
@@ -548,8 +831,7 @@ Examples:
         elif not video_info and not args.silent:
             print("⚠️  Could not retrieve video information")
             if not args.force and not args.no_interactive:
-                choice = input("Continue anyway? (y/n): ").strip().lower()
-                if choice not in ['y', 'yes']:
+                if not get_yes_no("Continue anyway? (y/n): ", default=False):
                     sys.exit(1)
 
         url = processed_url
@@ -602,11 +884,13 @@ Examples:
             output_dir = args.output
             custom_filename = args.filename
 
-    # Create output directory if it doesn't exist
-    Path(output_dir).mkdir(parents=True, exist_ok=True)
-
-    # Download with format conversion
-    downloader = YouTubeDownloader(output_dir, custom_filename, preferred_format)
+    # Download with format conversion (the downloader creates the output directory)
+    progress_hook = DefaultProgressHook(show_bar=not (is_playlist and args.playlist_workers > 1))
+    downloader = YouTubeDownloader(output_dir, custom_filename, preferred_format, progress_hook,
+                                   concurrent_fragments=args.concurrent_fragments,
+                                   playlist_workers=args.playlist_workers,
+                                   use_aria2c=args.aria2c,
+                                   embed_metadata=args.embed_metadata)
     success = downloader.download(url, quality, is_playlist, video_info, force_convert, args.silent)
 
     if success and not args.silent: